@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import os
+import sys
 
 LEET_MAP = {
     "a": "4",
@@ -11,34 +12,47 @@ LEET_MAP = {
     "t": "7"
 }
 
+# Buffer size for reading name lists and writing output (128 KiB)
+IO_BUFFER_SIZE = 1 << 17
+
+# Number of verbose messages buffered before they are written to stdout
+VERBOSE_BATCH_SIZE = 1000
+
+# Precomputed translation table so to_leet runs as a single C-level pass
+_LEET_TABLE = str.maketrans(LEET_MAP)
+
 
 def to_leet(word: str) -> str:
     """Convert a word into a leet-speak variant."""
-    return "".join(LEET_MAP.get(c, c) for c in word)
+    return word.translate(_LEET_TABLE)
 
 
 def generate_usernames(first: str, last: str, leet: bool = False) -> set:
     """Generate realistic username combinations given a first and last name."""
     first = first.lower()
     last = last.lower()
-
-    usernames = set()
-
-    # Common corporate username formats
-    usernames.add(first + "." + last)         # jane.doe
-    usernames.add(first[0] + last)            # jdoe
-    usernames.add(first[0] + "." + last)      # j.doe
-    usernames.add(first + last[0])            # janed
-    usernames.add(first + "_" + last)         # jane_doe
-    usernames.add(first + last)               # janedoe
-    usernames.add(last + first[0])            # doej
-    usernames.add(first)                      # jane
-    usernames.add(last)                       # doe
-
-    # Numeric variants
-    usernames.add(first[0] + last + "1")      # jdoe1
-    usernames.add(first + "." + last + "99")  # jane.doe99
-    usernames.add(first + last + "123")       # janedoe123
+    return _generate_usernames(first, last, first[0], last[0], leet)
+
+
+def _generate_usernames(first: str, last: str, fi: str, la: str, leet: bool) -> set:
+    """Core of generate_usernames; expects lowercased names and their initials."""
+    usernames = set((
+        # Common corporate username formats
+        first + "." + last,         # jane.doe
+        fi + last,                  # jdoe
+        fi + "." + last,            # j.doe
+        first + la,                 # janed
+        first + "_" + last,         # jane_doe
+        first + last,               # janedoe
+        last + fi,                  # doej
+        first,                      # jane
+        last,                       # doe
+
+        # Numeric variants
+        fi + last + "1",            # jdoe1
+        first + "." + last + "99",  # jane.doe99
+        first + last + "123",       # janedoe123
+    ))
 
     # Add leet variants if enabled
     if leet:
@@ -52,37 +66,49 @@ def generate_email_variants(first: str, last: str, domain: str, leet: bool = Fal
     """Generate realistic corporate-style email addresses."""
     first = first.lower()
     last = last.lower()
-    domain = domain.lower()
+    return _generate_email_variants(first, last, first[0], last[0], domain.lower(), leet)
 
-    emails = set()
 
-    # Most common corporate email patterns
-    emails.add(f"{first}.{last}@{domain}")     # jane.doe@example.com
-    emails.add(f"{first[0]}{last}@{domain}")   # jdoe@example.com
-    emails.add(f"{first[0]}.{last}@{domain}")  # j.doe@example.com
-    emails.add(f"{first}{last[0]}@{domain}")   # janed@example.com
-    emails.add(f"{first}{last}@{domain}")      # janedoe@example.com
-    emails.add(f"{last}{first[0]}@{domain}")   # doej@example.com
+def _generate_email_variants(first: str, last: str, fi: str, la: str,
+                             domain: str, leet: bool) -> set:
+    """Core of generate_email_variants; expects lowercased names, initials and domain."""
+    suffix = "@" + domain
 
-    # Secondary formats
-    emails.add(f"{first}@{domain}")            # jane@example.com
-    emails.add(f"{last}@{domain}")             # doe@example.com
+    emails = set((
+        # Most common corporate email patterns
+        first + "." + last + suffix,        # jane.doe@example.com
+        fi + last + suffix,                 # jdoe@example.com
+        fi + "." + last + suffix,           # j.doe@example.com
+        first + la + suffix,                # janed@example.com
+        first + last + suffix,              # janedoe@example.com
+        last + fi + suffix,                 # doej@example.com
 
-    # Numeric fallback patterns
-    emails.add(f"{first}.{last}1@{domain}")    # jane.doe1@example.com
-    emails.add(f"{first[0]}{last}99@{domain}") # jdoe99@example.com
+        # Secondary formats
+        first + suffix,                     # jane@example.com
+        last + suffix,                      # doe@example.com
+
+        # Numeric fallback patterns
+        first + "." + last + "1" + suffix,  # jane.doe1@example.com
+        fi + last + "99" + suffix,          # jdoe99@example.com
+    ))
 
     # Add leet variants if enabled
     if leet:
-        leet_emails = set()
-        for email in emails:
-            local, domain_part = email.split("@")
-            leet_emails.add(f"{to_leet(local)}@{domain_part}")
+        # Only the local part is converted; the domain is left untouched
+        suffix_len = len(suffix)
+        leet_emails = {to_leet(email[:-suffix_len]) + suffix for email in emails}
         emails.update(leet_emails)
 
     return emails
 
 
+def flush_lines(lines: list) -> None:
+    """Write buffered console messages to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 def process_file(input_file: str, output_file: str, leet: bool = False,
                  domain: str = None, verbose: bool = False) -> None:
     """Read names from input file, generate usernames/emails, and write to output file."""
@@ -90,49 +116,71 @@ def process_file(input_file: str, output_file: str, leet: bool = False,
         print(f"[-] Error: File '{input_file}' not found.")
         return
 
+    if domain:
+        domain = domain.lower()
+
     all_usernames = set()
+    verbose_lines = []
     total_lines = 0
     processed_lines = 0
 
-    with open(input_file, "r", encoding="utf-8") as infile:
-        for line in infile:
-            total_lines += 1
-            line = line.strip().replace("\r", "")
-            if not line:
-                continue
+    # Text mode already turns \r\n and bare \r line endings into \n
+    try:
+        with open(input_file, "r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as infile:
+            data = infile.read()
+    except UnicodeDecodeError as e:
+        print(f"[-] Error: File '{input_file}' is not valid UTF-8: {e}")
+        return
 
-            parts = line.split()
-            if len(parts) < 2:
-                if verbose:
-                    print(f"[!] Skipping invalid line {total_lines}: '{line}'")
-                continue
+    lines = data.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # Trailing newline doesn't start another line
 
-            first, last = parts[0], parts[-1]  # Handles middle names
+    for line in lines:
+        if len(verbose_lines) >= VERBOSE_BATCH_SIZE:
+            flush_lines(verbose_lines)
 
-            # Generate usernames
-            usernames = generate_usernames(first, last, leet=leet)
-            all_usernames.update(usernames)
+        total_lines += 1
+        line = line.strip()
+        if not line:
+            continue
 
+        parts = line.split()
+        if len(parts) < 2:
             if verbose:
-                print(f"[+] {first} {last} -> {len(usernames)} usernames")
+                verbose_lines.append(f"[!] Skipping invalid line {total_lines}: '{line}'")
+            continue
+
+        first, last = parts[0], parts[-1]  # Handles middle names
+        lower_first, lower_last = first.lower(), last.lower()
+        fi, la = lower_first[0], lower_last[0]
 
-            # Generate email variants if a domain is provided
-            if domain:
-                emails = generate_email_variants(first, last, domain, leet=leet)
-                all_usernames.update(emails)
+        # Generate usernames
+        usernames = _generate_usernames(lower_first, lower_last, fi, la, leet)
+        all_usernames.update(usernames)
+
+        if verbose:
+            verbose_lines.append(f"[+] {first} {last} -> {len(usernames)} usernames")
+
+        # Generate email variants if a domain is provided
+        if domain:
+            emails = _generate_email_variants(lower_first, lower_last, fi, la, domain, leet)
+            all_usernames.update(emails)
+
+            if verbose:
+                verbose_lines.append(f"    ↳ Added {len(emails)} email variants for {first} {last}")
 
-                if verbose:
-                    print(f"    ↳ Added {len(emails)} email variants for {first} {last}")
+        processed_lines += 1
 
-            processed_lines += 1
+    flush_lines(verbose_lines)
 
     if processed_lines == 0:
         print("[-] No valid names found in the input file.")
         return
 
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        for username in sorted(all_usernames):
-            outfile.write(username + "\n")
+    with open(output_file, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as outfile:
+        outfile.write("\n".join(sorted(all_usernames)))
+        outfile.write("\n")
 
     print(f"[+] Processed {processed_lines}/{total_lines} lines")
     print(f"[+] Generated {len(all_usernames)} unique usernames in '{output_file}'.")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import argparse
 import itertools
+import re
 import string
+import sys
 
 # Base list of simple, lazy common passwords (no years by default)
 COMMON_PASSWORDS = [
@@ -26,16 +28,23 @@ EXTRA_COMMON_PASSWORDS = [
     "pokemon123", "iloveyou123", "princess123", "taylor", "phoenix", "babygirl"
 ]
 
+# Pre-hashed copies of the seed lists so each call can copy them without rehashing
+COMMON_PASSWORD_SET = frozenset(COMMON_PASSWORDS)
+EXTRA_COMMON_PASSWORD_SET = frozenset(EXTRA_COMMON_PASSWORDS)
+
 # Mapping for leetspeak substitutions
 LEET_MAP = {
-    "a": ["4", "@"],
-    "e": ["3"],
-    "i": ["1", "!"],
-    "o": ["0"],
-    "s": ["5", "$"],
-    "t": ["7"]
+    "a": ("4", "@"),
+    "e": ("3",),
+    "i": ("1", "!"),
+    "o": ("0",),
+    "s": ("5", "$"),
+    "t": ("7",)
 }
 
+# Buffer size for streaming output files (128 KiB)
+IO_BUFFER_SIZE = 1 << 17
+
 # Mask character sets
 MASK_SETS = {
     "?u": string.ascii_uppercase,
@@ -44,15 +53,22 @@ MASK_SETS = {
     "?s": "!@#$%^&*"
 }
 
+# Splits a mask into MASK_SETS tokens and single literal characters
+MASK_TOKEN_RE = re.compile("|".join(map(re.escape, MASK_SETS)) + "|.", re.S)
+
 def generate_leet_variations(password: str):
     """Generate leet-style variants for a given password."""
     chars = []
+    leetable = False
     for c in password:
-        lower = c.lower()
-        if lower in LEET_MAP:
-            chars.append([c] + LEET_MAP[lower])
+        subs = LEET_MAP.get(c.lower())
+        if subs:
+            chars.append((c,) + subs)
+            leetable = True
         else:
-            chars.append([c])
+            chars.append((c,))
+    if not leetable:
+        return {password}
     return set("".join(p) for p in itertools.product(*chars))
 
 def generate_username_variations(username: str, year: str = None):
@@ -81,27 +97,33 @@ def generate_username_variations(username: str, year: str = None):
 
     return variations
 
+def generate_year_passwords(year, include_extra=False):
+    """Yield the common (and optionally breached) seed passwords with a year suffix."""
+    for pwd in COMMON_PASSWORDS:
+        yield pwd + year
+
+    if include_extra:
+        for pwd in EXTRA_COMMON_PASSWORDS:
+            yield pwd + year
+
 def generate_password_list(usernames, year=None, include_extra=False, leet=False):
     """Generate a comprehensive password list."""
-    all_passwords = set(COMMON_PASSWORDS)
-
-    if year:
-        for pwd in COMMON_PASSWORDS:
-            all_passwords.add(pwd + year)
+    all_passwords = set(COMMON_PASSWORD_SET)
 
     if include_extra:
-        all_passwords.update(EXTRA_COMMON_PASSWORDS)
-        if year:
-            for pwd in EXTRA_COMMON_PASSWORDS:
-                all_passwords.add(pwd + year)
+        all_passwords |= EXTRA_COMMON_PASSWORD_SET
+
+    if year:
+        all_passwords.update(generate_year_passwords(year, include_extra))
 
     for username in usernames:
         all_passwords.update(generate_username_variations(username, year))
 
     if leet:
-        leet_passwords = set()
+        # Collect into a list so the result set is only grown in one pass
+        leet_passwords = []
         for pwd in all_passwords:
-            leet_passwords.update(generate_leet_variations(pwd))
+            leet_passwords.extend(generate_leet_variations(pwd))
         all_passwords.update(leet_passwords)
 
     return sorted(all_passwords)
@@ -111,20 +133,25 @@ def generate_passwords_from_mask(mask: str):
     Generate passwords based on a hashcat-style mask.
     Example: ?u?l?l?l?l2022!
     """
-    parts = []
-    i = 0
-    while i < len(mask):
-        if mask[i] == '?' and i + 1 < len(mask):
-            token = mask[i:i+2]
-            if token in MASK_SETS:
-                parts.append(MASK_SETS[token])
-                i += 2
-                continue
-        parts.append(mask[i])
-        i += 1
+    parts = [MASK_SETS.get(token, token) for token in MASK_TOKEN_RE.findall(mask)]
 
     return ("".join(p) for p in itertools.product(*parts))
 
+def stream_mask_to_file(mask: str, fh, chunk: int = 4096):
+    """
+    Write every password for a mask to an open file, joining them in chunks.
+    Returns the number of passwords written.
+    """
+    passwords = generate_passwords_from_mask(mask)
+    count = 0
+    while True:
+        batch = list(itertools.islice(passwords, chunk))
+        if not batch:
+            return count
+        fh.write("\n".join(batch))
+        fh.write("\n")
+        count += len(batch)
+
 def main():
     parser = argparse.ArgumentParser(
         description=(
@@ -151,18 +178,36 @@ def main():
     parser.add_argument("--extra", action="store_true", help="Include top 100 breached passwords.")
     parser.add_argument("--leet", action="store_true", help="Generate leet-style variants.")
     parser.add_argument("--mask", help="Custom hashcat-style mask, e.g. '?u?l?l?l?l2022!'")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream mask output unsorted without buffering (mask-only mode).")
 
     args = parser.parse_args()
 
+    if args.stream and (args.input or not args.mask):
+        parser.error("--stream requires --mask and cannot be combined with --input")
+
+    if args.stream:
+        # Large masks can't be held in memory, so write passwords as they're generated
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+                count = stream_mask_to_file(args.mask, f)
+            print(f"[+] Generated {count} passwords and saved to '{args.output}'")
+        else:
+            stream_mask_to_file(args.mask, sys.stdout)
+        return
+
     passwords = set()
 
     if args.input:
         try:
-            with open(args.input, "r", encoding="utf-8") as f:
-                usernames = [line.strip() for line in f if line.strip()]
+            with open(args.input, "r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+                usernames = [u for u in map(str.strip, f.read().split("\n")) if u]
         except FileNotFoundError:
             print(f"[!] Input file '{args.input}' not found.")
             return
+        except UnicodeDecodeError as e:
+            print(f"[!] Input file '{args.input}' is not valid UTF-8: {e}")
+            return
         passwords.update(generate_password_list(usernames, args.year, args.extra, args.leet))
 
     if args.mask:
@@ -173,9 +218,9 @@ def main():
         return
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            for pwd in sorted(passwords):
-                f.write(pwd + "\n")
+        with open(args.output, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+            f.write("\n".join(sorted(passwords)))
+            f.write("\n")
         print(f"[+] Generated {len(passwords)} passwords and saved to '{args.output}'")
     else:
         for pwd in sorted(passwords):
@@ -8,6 +8,9 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from urllib.parse import urljoin
 import argparse
 import os
@@ -15,38 +18,63 @@ import os
 COMMON_DIRS = ["admin", "login", "dashboard", "config", "uploads", "images"]
 XSS_PAYLOADS = ["<script>alert('XSS')</script>", "'\"><img src=x onerror=alert(1)>"]
 SQLI_PAYLOADS = ["' OR '1'='1", "' OR 'a'='a"]
+# Pre-encoded payloads so reflections can be checked against the raw response body
+XSS_PAYLOAD_BYTES = {payload: payload.encode("utf-8") for payload in XSS_PAYLOADS}
+MAX_WORKERS = 16
+# (connect, read) timeouts so unreachable hosts fail fast without cutting off slow pages
+TIMEOUT = (1.5, 5)
+
+def probe(session, task):
+    """Run a single probe and return the finding to record, or None."""
+    kind, target, payload = task
+    try:
+        # Directory brute-force
+        if kind == "dirs":
+            # Only the status code matters, so skip downloading the body
+            status = session.head(target, allow_redirects=True, timeout=TIMEOUT).status_code
+            if status in (405, 501):
+                # Some servers reject HEAD; fall back to a GET that is closed unread
+                with session.get(target, allow_redirects=True, stream=True, timeout=TIMEOUT) as r:
+                    status = r.status_code
+            return target if status != 404 else None
+
+        # XSS check
+        if kind == "xss":
+            r = session.get(target, params={"q": payload}, timeout=TIMEOUT)
+            return payload if XSS_PAYLOAD_BYTES[payload] in r.content else None
+
+        # SQLi check
+        r = session.get(target, params={"id": payload}, timeout=TIMEOUT)
+        body = r.content.lower()
+        if b"error" in body or b"sql" in body:
+            return payload
+        return None
+    except requests.RequestException:
+        return None
 
 def scan_url(url):
     results = {"xss": [], "sqli": [], "dirs": []}
     print(f"[+] Scanning {url}...")
 
-    # Directory brute-force
-    for d in COMMON_DIRS:
-        full_url = urljoin(url, d)
-        try:
-            r = requests.get(full_url, timeout=5)
-            if r.status_code != 404:
-                results["dirs"].append(full_url)
-        except requests.RequestException:
-            continue
+    tasks = ([("dirs", urljoin(url, d), None) for d in COMMON_DIRS]
+             + [("xss", url, payload) for payload in XSS_PAYLOADS]
+             + [("sqli", url, payload) for payload in SQLI_PAYLOADS])
 
-    # XSS check
-    for payload in XSS_PAYLOADS:
-        try:
-            r = requests.get(url, params={"q": payload}, timeout=5)
-            if payload in r.text:
-                results["xss"].append(payload)
-        except requests.RequestException:
-            continue
+    # Share one keep-alive connection pool across all probes
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
-    # SQLi check
-    for payload in SQLI_PAYLOADS:
-        try:
-            r = requests.get(url, params={"id": payload}, timeout=5)
-            if "error" in r.text.lower() or "sql" in r.text.lower():
-                results["sqli"].append(payload)
-        except requests.RequestException:
-            continue
+    try:
+        # Probes are network-bound, so run them concurrently; map keeps task order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            findings = pool.map(partial(probe, session), tasks)
+            for (kind, _, _), finding in zip(tasks, findings):
+                if finding is not None:
+                    results[kind].append(finding)
+    finally:
+        session.close()
 
     return results
 